@@ -0,0 +1,13 @@
+# Production launch config, run from the backend directory:
+#   gunicorn -c gunicorn.conf.py
+# Each worker is a separate process running its own event loop. The Uvicorn
+# worker uses loop="auto"/http="auto", which pick uvloop and httptools since
+# both come with uvicorn[standard].
+import multiprocessing
+import os
+
+wsgi_app = "server:app"
+bind = os.environ.get("BIND", "0.0.0.0:8001")
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+keepalive = 5
@@ -1,12 +1,14 @@
-from fastapi import FastAPI, APIRouter, HTTPException
+from fastapi import FastAPI, APIRouter, HTTPException, Query
+from fastapi.responses import JSONResponse, StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient
 import os
 import logging
 from pathlib import Path
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from pydantic import BaseModel
+from typing import Any
+import msgspec
 import uuid
 from datetime import datetime
 
@@ -16,97 +18,161 @@ load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+# Keep a few connections open in the background so the first requests don't
+# pay for the TCP/auth handshake
+client = AsyncMongoClient(mongo_url, minPoolSize=5, maxPoolSize=50, maxIdleTimeMS=60000)
 db = client[os.environ['DB_NAME']]
 
+
+# Shared encoder; msgspec encoders are meant to be created once and reused
+json_encoder = msgspec.json.Encoder()
+
+class MsgspecJSONResponse(JSONResponse):
+    """JSON response encoded with msgspec instead of the stdlib json module."""
+
+    def render(self, content: Any) -> bytes:
+        return json_encoder.encode(content)
+
 # Create the main app without a prefix
-app = FastAPI()
+app = FastAPI(default_response_class=MsgspecJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
 
+def new_id() -> str:
+    return str(uuid.uuid4())
+
 # Define Models
-class StatusCheck(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+# Response schema only (for msgspec_response); handlers return plain dicts
+class StatusCheck(msgspec.Struct):
+    id: str
     client_name: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime
 
 class StatusCheckCreate(BaseModel):
     client_name: str
 
-class Project(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+# Response schema only (for msgspec_response); handlers store and return
+# plain dicts, and only the request body, ProjectCreate, goes through Pydantic
+class Project(msgspec.Struct, kw_only=True):
+    id: str
     title: str
     description: str
-    tech_stack: List[str]
+    tech_stack: list[str]
     image_url: str
-    demo_url: Optional[str] = None
-    github_url: Optional[str] = None
+    demo_url: str | None = None
+    github_url: str | None = None
     category: str
-    created_date: datetime = Field(default_factory=datetime.utcnow)
+    created_date: datetime
     featured: bool = False
 
 class ProjectCreate(BaseModel):
     title: str
     description: str
-    tech_stack: List[str]
+    tech_stack: list[str]
     image_url: str
-    demo_url: Optional[str] = None
-    github_url: Optional[str] = None
+    demo_url: str | None = None
+    github_url: str | None = None
     category: str
     featured: bool = False
 
+def msgspec_response(tp: Any) -> dict:
+    """Build a `responses=` entry documenting a msgspec type, which FastAPI can't do itself."""
+    (schema,), components = msgspec.json.schema_components((tp,), ref_template="{name}")
+
+    def inline(node: Any) -> Any:
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return inline(components[node["$ref"]])
+            return {key: inline(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [inline(value) for value in node]
+        return node
+
+    return {200: {"content": {"application/json": {"schema": inline(schema)}}}}
+
 # Add your routes to the router instead of directly to app
 @api_router.get("/")
 async def root():
-    return {"message": "Hello World"}
+    return MsgspecJSONResponse({"message": "Hello World"})
 
-@api_router.post("/status", response_model=StatusCheck)
+@api_router.post("/status", response_model=None, responses=msgspec_response(StatusCheck))
 async def create_status_check(input: StatusCheckCreate):
-    status_dict = input.dict()
-    status_obj = StatusCheck(**status_dict)
-    _ = await db.status_checks.insert_one(status_obj.dict())
-    return status_obj
+    status_dict = input.model_dump()
+    status_dict["id"] = new_id()
+    status_dict["timestamp"] = datetime.utcnow()
+    _ = await db.status_checks.insert_one(status_dict)
+    # insert_one adds Mongo's _id to the dict it was given
+    del status_dict["_id"]
+    return MsgspecJSONResponse(status_dict)
 
-@api_router.get("/status", response_model=List[StatusCheck])
-async def get_status_checks():
-    status_checks = await db.status_checks.find().to_list(1000)
-    return [StatusCheck(**status_check) for status_check in status_checks]
+@api_router.get("/status", response_model=None, responses=msgspec_response(list[StatusCheck]))
+async def get_status_checks(skip: int = Query(0, ge=0), limit: int = Query(0, ge=0)):
+    # limit=0 means no limit, matching pymongo's own convention
+    status_checks = await db.status_checks.find(
+        {}, projection={"_id": 0}, skip=skip, limit=limit
+    ).to_list(length=None)
+    return MsgspecJSONResponse(status_checks)
 
 # Project routes
-@api_router.get("/projects", response_model=List[Project])
-async def get_projects():
-    projects = await db.projects.find().to_list(1000)
-    return [Project(**project) for project in projects]
+# Read routes return trusted Mongo documents as-is; response models here only
+# document the payload and are not used to re-validate it.
+@api_router.get("/projects", response_model=None, responses=msgspec_response(list[Project]))
+async def get_projects(skip: int = Query(0, ge=0), limit: int = Query(0, ge=0)):
+    cursor = db.projects.find({}, projection={"_id": 0}, skip=skip, limit=limit)
+    # Fetch the first document before any headers go out, so a database error
+    # still surfaces as a 500 rather than a 200 with a broken body
+    try:
+        first_project = await anext(cursor, None)
+    except BaseException:
+        await cursor.close()
+        raise
+    if first_project is None:
+        await cursor.close()
+        return MsgspecJSONResponse([])
+
+    # Encode one document at a time as the cursor yields it, so memory stays
+    # flat no matter how many projects there are
+    async def stream_projects():
+        try:
+            yield b"[" + json_encoder.encode(first_project)
+            async for project in cursor:
+                yield b"," + json_encoder.encode(project)
+            yield b"]"
+        finally:
+            # Also runs when the client disconnects midway
+            await cursor.close()
+
+    return StreamingResponse(stream_projects(), media_type="application/json")
 
-@api_router.get("/projects/{project_id}", response_model=Project)
+@api_router.get("/projects/{project_id}", response_model=None, responses=msgspec_response(Project))
 async def get_project(project_id: str):
-    project = await db.projects.find_one({"id": project_id})
+    project = await db.projects.find_one({"id": project_id}, projection={"_id": 0})
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
-    return Project(**project)
+    return MsgspecJSONResponse(project)
 
-@api_router.post("/projects", response_model=Project)
+@api_router.post("/projects", response_model=None, responses=msgspec_response(Project))
 async def create_project(project: ProjectCreate):
-    project_dict = project.dict()
-    project_obj = Project(**project_dict)
-    _ = await db.projects.insert_one(project_obj.dict())
-    return project_obj
+    project_dict = project.model_dump()
+    project_dict["id"] = new_id()
+    project_dict["created_date"] = datetime.utcnow()
+    _ = await db.projects.insert_one(project_dict)
+    del project_dict["_id"]
+    return MsgspecJSONResponse(project_dict)
 
 @api_router.delete("/projects/{project_id}")
 async def delete_project(project_id: str):
     result = await db.projects.delete_one({"id": project_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Project not found")
-    return {"message": "Project deleted successfully"}
+    return MsgspecJSONResponse({"message": "Project deleted successfully"})
 
-@api_router.post("/projects/sample")
-async def create_sample_projects():
-    # Clear existing projects
-    await db.projects.delete_many({})
-    
-    sample_projects = [
+# Sample data is constant, so validate it once at import rather than per request
+SAMPLE_PROJECTS = [
+    ProjectCreate(**project_data).model_dump()
+    for project_data in [
         {
             "title": "AI-Powered Chat Application",
             "description": "A modern chat application with AI integration, real-time messaging, and beautiful UI. Features include smart responses, conversation history, and responsive design.",
@@ -168,33 +234,59 @@ async def create_sample_projects():
             "featured": True
         }
     ]
+]
+
+@api_router.post("/projects/sample")
+async def create_sample_projects():
+    # Clear existing projects
+    await db.projects.delete_many({})
     
-    created_projects = []
-    for project_data in sample_projects:
-        project_obj = Project(**project_data)
-        await db.projects.insert_one(project_obj.dict())
-        created_projects.append(project_obj)
+    created_projects = [
+        {**project_data, "id": new_id(), "created_date": datetime.utcnow()}
+        for project_data in SAMPLE_PROJECTS
+    ]
+    await db.projects.insert_many(created_projects, ordered=False)
+    # insert_many adds Mongo's _id to each dict, as insert_one does above
+    for project_dict in created_projects:
+        del project_dict["_id"]
     
-    return {"message": f"Created {len(created_projects)} sample projects", "projects": created_projects}
+    return MsgspecJSONResponse({"message": f"Created {len(created_projects)} sample projects", "projects": created_projects})
 
 # Include the router in the main app
 app.include_router(api_router)
 
+# Allowed browser origins, comma-separated. The frontend doesn't send
+# cookies, so credentials stay off.
+cors_origins = tuple(
+    origin.strip()
+    for origin in os.environ.get('CORS_ORIGINS', 'http://localhost:3000').split(',')
+    if origin.strip()
+)
+
 app.add_middleware(
     CORSMiddleware,
-    allow_credentials=True,
-    allow_origins=["*"],
+    allow_credentials=False,
+    allow_origins=cors_origins,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure logging, unless the server (e.g. uvicorn/gunicorn) already has.
+# Keep hot-path log calls lazy: logger.info("... %s", value), or guard
+# expensive messages with logger.isEnabledFor(...)
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def ensure_indexes():
+    # Documents are looked up and deleted by their UUID `id`, not Mongo's `_id`
+    await db.projects.create_index("id", unique=True)
+    await db.status_checks.create_index("id", unique=True)
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    client.close()
\ No newline at end of file
+    await client.close()
\ No newline at end of file
@@ -1,21 +1,26 @@
 #!/usr/bin/env python3
-import requests
+import asyncio
+import httpx
 import json
 import uuid
 import time
 import sys
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 # Get the backend URL from the frontend .env file
 BACKEND_URL = "https://319e625e-1b32-431c-ab95-9fe03fae0f37.preview.emergentagent.com/api"
 
+# Keep connections to the backend alive across tests so only the first request
+# per connection pays the TCP/TLS handshake
+CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=20)
+
 def print_test_header(test_name: str) -> None:
     """Print a formatted test header."""
     print(f"\n{'=' * 80}")
     print(f"TEST: {test_name}")
     print(f"{'=' * 80}")
 
-def print_response(response: requests.Response) -> None:
+def print_response(response: httpx.Response) -> None:
     """Print formatted response details."""
     print(f"Status Code: {response.status_code}")
     print(f"Headers: {dict(response.headers)}")
@@ -24,12 +29,11 @@ def print_response(response: requests.Response) -> None:
     except:
         print(f"Response Body: {response.text}")
 
-def test_api_health() -> bool:
+async def test_api_health(client: httpx.AsyncClient) -> bool:
     """Test the API health check endpoint."""
-    print_test_header("API Health Check")
-    
     try:
-        response = requests.get(f"{BACKEND_URL}/")
+        response = await client.get("/")
+        print_test_header("API Health Check")
         print_response(response)
         
         if response.status_code == 200 and "message" in response.json():
@@ -42,18 +46,17 @@ def test_api_health() -> bool:
         print(f"❌ API health check failed with exception: {str(e)}")
         return False
 
-def test_cors() -> bool:
+async def test_cors(client: httpx.AsyncClient) -> bool:
     """Test CORS configuration."""
-    print_test_header("CORS Configuration")
-    
     try:
         # Send an OPTIONS request to check CORS headers
-        response = requests.options(f"{BACKEND_URL}/", 
-                                   headers={
-                                       "Origin": "http://example.com",
-                                       "Access-Control-Request-Method": "GET",
-                                       "Access-Control-Request-Headers": "Content-Type"
-                                   })
+        response = await client.options("/", 
+                                        headers={
+                                            "Origin": "http://localhost:3000",
+                                            "Access-Control-Request-Method": "GET",
+                                            "Access-Control-Request-Headers": "Content-Type"
+                                        })
+        print_test_header("CORS Configuration")
         print_response(response)
         
         # Check if CORS headers are present
@@ -69,12 +72,11 @@ def test_cors() -> bool:
         print(f"❌ CORS test failed with exception: {str(e)}")
         return False
 
-def test_create_sample_projects() -> bool:
+async def test_create_sample_projects(client: httpx.AsyncClient) -> bool:
     """Test creating sample projects."""
-    print_test_header("Create Sample Projects")
-    
     try:
-        response = requests.post(f"{BACKEND_URL}/projects/sample")
+        response = await client.post("/projects/sample")
+        print_test_header("Create Sample Projects")
         print_response(response)
         
         if response.status_code == 200 and "projects" in response.json():
@@ -114,12 +116,11 @@ def test_create_sample_projects() -> bool:
         print(f"❌ Sample projects creation failed with exception: {str(e)}")
         return False
 
-def test_get_all_projects() -> Optional[List[Dict[str, Any]]]:
+async def test_get_all_projects(client: httpx.AsyncClient) -> Optional[List[Dict[str, Any]]]:
     """Test fetching all projects."""
-    print_test_header("Get All Projects")
-    
     try:
-        response = requests.get(f"{BACKEND_URL}/projects")
+        response = await client.get("/projects")
+        print_test_header("Get All Projects")
         print_response(response)
         
         if response.status_code == 200:
@@ -133,12 +134,54 @@ def test_get_all_projects() -> Optional[List[Dict[str, Any]]]:
         print(f"❌ Get all projects failed with exception: {str(e)}")
         return None
 
-def test_get_project_by_id(project_id: str) -> bool:
+async def test_pagination(client: httpx.AsyncClient, projects: List[Dict[str, Any]]) -> bool:
+    """Test skip/limit paging on the list endpoints."""
+    try:
+        page_response = await client.get("/projects", params={"skip": 1, "limit": 2})
+        unbounded_response = await client.get("/projects", params={"limit": 0})
+        # Skipping past every project exercises the empty-array response
+        empty_response = await client.get("/projects", params={"skip": len(projects)})
+        bad_projects_response = await client.get("/projects", params={"limit": -1})
+        bad_status_response = await client.get("/status", params={"skip": -1})
+        print_test_header("Pagination")
+        print_response(page_response)
+        
+        if page_response.status_code != 200:
+            print("❌ Failed to retrieve a page of projects")
+            return False
+        page_ids = [project["id"] for project in page_response.json()]
+        expected_ids = [project["id"] for project in projects[1:3]]
+        if page_ids != expected_ids:
+            print(f"❌ Expected projects {expected_ids} for skip=1&limit=2, got {page_ids}")
+            return False
+        print("✅ skip=1&limit=2 returned the second and third projects")
+        
+        if unbounded_response.status_code != 200 or len(unbounded_response.json()) != len(projects):
+            print(f"❌ Expected limit=0 to return all {len(projects)} projects")
+            return False
+        print("✅ limit=0 returned every project")
+        
+        if empty_response.status_code != 200 or empty_response.json() != []:
+            print(f"❌ Expected [] when skipping past every project, got {empty_response.text!r}")
+            return False
+        print("✅ Skipping past every project returned []")
+        
+        for name, response in (("/projects?limit=-1", bad_projects_response),
+                               ("/status?skip=-1", bad_status_response)):
+            if response.status_code != 422:
+                print(f"❌ Expected 422 for {name}, got {response.status_code}")
+                return False
+        print("✅ Negative skip/limit values are rejected with 422")
+        return True
+    except Exception as e:
+        print(f"❌ Pagination test failed with exception: {str(e)}")
+        return False
+
+async def test_get_project_by_id(client: httpx.AsyncClient, project_id: str) -> bool:
     """Test fetching a specific project by ID."""
-    print_test_header(f"Get Project by ID: {project_id}")
-    
     try:
-        response = requests.get(f"{BACKEND_URL}/projects/{project_id}")
+        response = await client.get(f"/projects/{project_id}")
+        print_test_header(f"Get Project by ID: {project_id}")
         print_response(response)
         
         if response.status_code == 200 and "id" in response.json():
@@ -156,10 +199,8 @@ def test_get_project_by_id(project_id: str) -> bool:
         print(f"❌ Get project by ID failed with exception: {str(e)}")
         return False
 
-def test_create_project() -> Optional[str]:
+async def test_create_project(client: httpx.AsyncClient) -> Optional[str]:
     """Test creating a new project."""
-    print_test_header("Create New Project")
-    
     new_project = {
         "title": "Test Project",
         "description": "This is a test project created by the automated test script",
@@ -172,10 +213,11 @@ def test_create_project() -> Optional[str]:
     }
     
     try:
-        response = requests.post(
-            f"{BACKEND_URL}/projects",
+        response = await client.post(
+            "/projects",
             json=new_project
         )
+        print_test_header("Create New Project")
         print_response(response)
         
         if response.status_code == 200 and "id" in response.json():
@@ -189,19 +231,21 @@ def test_create_project() -> Optional[str]:
         print(f"❌ Create project failed with exception: {str(e)}")
         return None
 
-def test_delete_project(project_id: str) -> bool:
+async def test_delete_project(client: httpx.AsyncClient, project_id: str) -> bool:
     """Test deleting a project."""
-    print_test_header(f"Delete Project: {project_id}")
-    
     try:
-        response = requests.delete(f"{BACKEND_URL}/projects/{project_id}")
+        response = await client.delete(f"/projects/{project_id}")
+        # Verify the project is actually deleted; both requests finish before
+        # printing so concurrent tests can't interleave with this output
+        verify_response = None
+        if response.status_code == 200:
+            verify_response = await client.get(f"/projects/{project_id}")
+        print_test_header(f"Delete Project: {project_id}")
         print_response(response)
         
-        if response.status_code == 200:
+        if verify_response is not None:
             print(f"✅ Successfully deleted project with ID: {project_id}")
             
-            # Verify the project is actually deleted
-            verify_response = requests.get(f"{BACKEND_URL}/projects/{project_id}")
             if verify_response.status_code == 404:
                 print("✅ Verified project was deleted (404 Not Found)")
                 return True
@@ -215,13 +259,12 @@ def test_delete_project(project_id: str) -> bool:
         print(f"❌ Delete project failed with exception: {str(e)}")
         return False
 
-def test_delete_nonexistent_project() -> bool:
+async def test_delete_nonexistent_project(client: httpx.AsyncClient) -> bool:
     """Test deleting a non-existent project."""
-    print_test_header("Delete Non-existent Project")
-    
     fake_id = str(uuid.uuid4())
     try:
-        response = requests.delete(f"{BACKEND_URL}/projects/{fake_id}")
+        response = await client.delete(f"/projects/{fake_id}")
+        print_test_header("Delete Non-existent Project")
         print_response(response)
         
         if response.status_code == 404:
@@ -234,46 +277,60 @@ def test_delete_nonexistent_project() -> bool:
         print(f"❌ Delete non-existent project test failed with exception: {str(e)}")
         return False
 
-def run_all_tests():
-    """Run all API tests in sequence."""
+async def run_create_and_delete_project(client: httpx.AsyncClient) -> Tuple[Optional[str], bool]:
+    """Create a new project, then delete it (the delete depends on the create)."""
+    new_project_id = await test_create_project(client)
+    if new_project_id:
+        return new_project_id, await test_delete_project(client, new_project_id)
+    print("❌ Skipping Delete Project test as no project was created")
+    return None, False
+
+async def run_all_tests():
+    """Run all API tests, concurrently wherever they do not depend on each other."""
     print("\n🔍 Starting Backend API Tests 🔍\n")
     
     test_results = {}
     
-    # Test 1: API Health Check
-    test_results["API Health Check"] = test_api_health()
-    
-    # Test 2: CORS Configuration
-    test_results["CORS Configuration"] = test_cors()
-    
-    # Test 3: Create Sample Projects
-    test_results["Create Sample Projects"] = test_create_sample_projects()
-    
-    # Test 4: Get All Projects
-    projects = test_get_all_projects()
-    test_results["Get All Projects"] = projects is not None and len(projects) > 0
-    
-    # Test 5: Get Project by ID (if we have projects)
-    if projects and len(projects) > 0:
-        project_id = projects[0]["id"]
-        test_results["Get Project by ID"] = test_get_project_by_id(project_id)
-    else:
-        test_results["Get Project by ID"] = False
-        print("❌ Skipping Get Project by ID test as no projects were retrieved")
-    
-    # Test 6: Create New Project
-    new_project_id = test_create_project()
-    test_results["Create New Project"] = new_project_id is not None
-    
-    # Test 7: Delete Project (if we created one)
-    if new_project_id:
-        test_results["Delete Project"] = test_delete_project(new_project_id)
-    else:
-        test_results["Delete Project"] = False
-        print("❌ Skipping Delete Project test as no project was created")
+    async with httpx.AsyncClient(base_url=BACKEND_URL, http2=True, limits=CLIENT_LIMITS) as client:
+        # Tests 1, 2, 3 and 8: independent of each other
+        (
+            test_results["API Health Check"],
+            test_results["CORS Configuration"],
+            test_results["Create Sample Projects"],
+            delete_nonexistent_result,
+        ) = await asyncio.gather(
+            test_api_health(client),
+            test_cors(client),
+            test_create_sample_projects(client),
+            test_delete_nonexistent_project(client),
+        )
+        
+        # Test 4: Get All Projects (sample creation clears the collection, so run after it)
+        projects = await test_get_all_projects(client)
+        test_results["Get All Projects"] = projects is not None and len(projects) > 0
+        
+        # Pagination compares against the full listing, so run it before Test 6 adds a project
+        if projects and len(projects) >= 3:
+            test_results["Pagination"] = await test_pagination(client, projects)
+        else:
+            test_results["Pagination"] = False
+            print("❌ Skipping Pagination test as fewer than 3 projects were retrieved")
+        
+        # Test 5: Get Project by ID, alongside Tests 6 and 7: Create then Delete Project
+        async def get_first_project() -> bool:
+            if projects and len(projects) > 0:
+                return await test_get_project_by_id(client, projects[0]["id"])
+            print("❌ Skipping Get Project by ID test as no projects were retrieved")
+            return False
+        
+        test_results["Get Project by ID"], (new_project_id, delete_result) = await asyncio.gather(
+            get_first_project(),
+            run_create_and_delete_project(client),
+        )
+        test_results["Create New Project"] = new_project_id is not None
+        test_results["Delete Project"] = delete_result
     
-    # Test 8: Delete Non-existent Project
-    test_results["Delete Non-existent Project"] = test_delete_nonexistent_project()
+    test_results["Delete Non-existent Project"] = delete_nonexistent_result
     
     # Print summary
     print("\n" + "=" * 80)
@@ -297,5 +354,5 @@ def run_all_tests():
     return all_passed
 
 if __name__ == "__main__":
-    success = run_all_tests()
+    success = asyncio.run(run_all_tests())
     sys.exit(0 if success else 1)
\ No newline at end of file